@@ -103,7 +103,7 @@ class Analysis:
            A list of all the requirements processed for evaluation.
         """
         all_requirements = []
-        for need in deepcopy(needs):
+        for need in needs:
             try:
                 requirement = need.split(":")
                 requirement = [requirement[0].split("."), requirement[1]]
@@ -127,9 +127,7 @@ class Analysis:
 
     @job_id.setter
     def job_id(self, value):
-        if "scheduler" not in self.meta:
-            self.meta["scheduler"] = {}
-        self.meta["scheduler"]["job id"] = value
+        self.meta.setdefault("scheduler", {})["job id"] = value
 
     @property
     def dependencies(self):
@@ -140,7 +138,7 @@ class Analysis:
         else:
             matches = set({})  # set(self.event.analyses)
             # matches.remove(self)
-            requirements = self._process_dependencies(deepcopy(self._needs))
+            requirements = self._process_dependencies(self._needs)
             for attribute, match in requirements:
                 filtered_analyses = list(
                     filter(
@@ -169,7 +167,8 @@ class Analysis:
 
     @property
     def status(self):
-        return self.status_str.lower()
+        # The status is normalised to lower case whenever it is set.
+        return self.status_str
 
     @status.setter
     def status(self, value):
@@ -215,7 +214,7 @@ class Analysis:
         if attribute[0] == "review":
             is_review = match.lower() == str(self.review.status).lower()
         elif attribute[0] == "status":
-            is_status = match.lower() == self.status.lower()
+            is_status = match.lower() == self.status
         elif attribute[0] == "name":
             is_name = match == self.name
         else:
@@ -417,10 +416,9 @@ class Analysis:
         dictionary["job id"] = self.job_id
 
         # Remove duplicates of pipeline defaults
-        if self.pipeline.name.lower() in self.event.ledger.data["pipelines"]:
-            defaults = deepcopy(
-                self.event.ledger.data["pipelines"][self.pipeline.name.lower()]
-            )
+        pipeline_name = self.pipeline.name.lower()
+        if pipeline_name in self.event.ledger.data["pipelines"]:
+            defaults = deepcopy(self.event.ledger.data["pipelines"][pipeline_name])
         else:
             defaults = {}
 
@@ -495,10 +493,14 @@ class SimpleAnalysis(Analysis):
 
         # self.meta["pipeline"] = pipeline
 
-        # Update with the subject defaults
-        self.meta = update(self.meta, deepcopy(self.subject.meta))
-        if "productions" in self.meta:
-            self.meta.pop("productions")
+        # Update with the subject defaults, leaving out the subject's
+        # own analyses rather than copying them only to discard them.
+        subject_meta = {
+            key: value
+            for key, value in self.subject.meta.items()
+            if key != "productions"
+        }
+        self.meta = update(self.meta, deepcopy(subject_meta))
         self.meta = update(self.meta, deepcopy(kwargs))
 
         self.pipeline = pipeline.lower()
@@ -810,7 +812,7 @@ class ProjectAnalysis(Analysis):
         else:
             matches = set({})  # set(self.event.analyses)
             # matches.remove(self)
-            requirements = self._process_dependencies(deepcopy(self._needs))
+            requirements = self._process_dependencies(self._needs)
             analyses = []
             for subject in self._subjects:
                 sub = self.ledger.get_event(subject)[0]
@@ -935,18 +937,9 @@ class GravitationalWaveTransient(SimpleAnalysis):
             # TODO: Should probably raise a deprecation warning
             self.meta["sampler"]["cip jobs"] = self.meta["cip jobs"]
 
-        if "scheduler" not in self.meta:
-            self.meta["scheduler"] = {}
-
-        if "likelihood" not in self.meta:
-            self.meta["likelihood"] = {}
-        if "marginalization" not in self.meta["likelihood"]:
-            self.meta["likelihood"]["marginalization"] = {}
-
-        if "data" not in self.meta:
-            self.meta["data"] = {}
-        if "data files" not in self.meta["data"]:
-            self.meta["data"]["data files"] = {}
+        self.meta.setdefault("scheduler", {})
+        self.meta.setdefault("likelihood", {}).setdefault("marginalization", {})
+        self.meta.setdefault("data", {}).setdefault("data files", {})
 
         if "lmax" in self.meta:
             # TODO: Should probably raise a deprecation warning
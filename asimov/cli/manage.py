@@ -115,7 +115,7 @@ def build(event, dryrun):
                 if dryrun:
                     click.echo(
                         click.style("●", fg="yellow")
-                        + f" {production.name} is marked as {production.status.lower()} so no action will be performed"
+                        + f" {production.name} is marked as {production.status} so no action will be performed"
                     )
                 continue  # I think this test might be unused
             try:
@@ -423,7 +423,7 @@ def submit(event, update, dryrun):
         ready_productions = event.get_all_latest()
         for production in ready_productions:
             logger.info(f"{event.name}/{production.name}")
-            if production.status.lower() in {
+            if production.status in {
                 "running",
                 "stuck",
                 "wait",
@@ -437,10 +437,10 @@ def submit(event, update, dryrun):
                 if dryrun:
                     click.echo(
                         click.style("●", fg="yellow")
-                        + f" {production.name} is marked as {production.status.lower()} so no action will be performed"
+                        + f" {production.name} is marked as {production.status} so no action will be performed"
                     )
                 continue
-            if production.status.lower() == "restart":
+            if production.status == "restart":
                 pipe = production.pipeline
                 try:
                     pipe.clean(dryrun=dryrun)
@@ -126,7 +126,7 @@ def monitor(ctx, event, update, dry_run, chain):
     for analysis in ledger.project_analyses:
         click.secho(f"Subjects: {analysis.subjects}", bold=True)
 
-        if analysis.status.lower() in ACTIVE_STATES:
+        if analysis.status in ACTIVE_STATES:
             logger.debug(f"Available analyses:  project_analyses/{analysis.name}")
 
             click.echo(
@@ -136,13 +136,13 @@ def monitor(ctx, event, update, dry_run, chain):
             )
 
             # ignore the analysis if it is set to ready as it has not been started yet
-            if analysis.status.lower() == "ready":
-                click.secho(f"  \t  ● {analysis.status.lower()}", fg="green")
+            if analysis.status == "ready":
+                click.secho(f"  \t  ● {analysis.status}", fg="green")
                 logger.debug(f"Ready production: project_analyses/{analysis.name}")
                 continue
 
             # check if there are jobs that need to be stopped
-            if analysis.status.lower() == "stop":
+            if analysis.status == "stop":
                 pipe = analysis.pipeline
                 logger.debug(f"Stop production project_analyses/{analysis.name}")
                 if not dry_run:
@@ -216,7 +216,7 @@ def monitor(ctx, event, update, dry_run, chain):
             except (ValueError, AttributeError):
                 if analysis.pipeline:
                     pipe = analysis.pipeline
-                    if analysis.status.lower() == "stop":
+                    if analysis.status == "stop":
                         pipe.eject_job()
                         analysis.status = "stopped"
                         ledger.update_analysis_in_project_analysis(analysis)
@@ -227,7 +227,7 @@ def monitor(ctx, event, update, dry_run, chain):
                         )
                         job_list.refresh()
 
-                    elif analysis.status.lower() == "finished":
+                    elif analysis.status == "finished":
                         pipe.after_completion()
                         click.echo(
                             "  \t  "
@@ -236,7 +236,7 @@ def monitor(ctx, event, update, dry_run, chain):
                         )
                         job_list.refresh()
 
-                    elif analysis.status.lower() == "processing":
+                    elif analysis.status == "processing":
                         if pipe.detect_completion_processing():
                             try:
                                 pipe.after_processing()
@@ -257,7 +257,7 @@ def monitor(ctx, event, update, dry_run, chain):
 
                     elif (
                         pipe.detect_completion()
-                        and analysis.status.lower() == "processing"
+                        and analysis.status == "processing"
                     ):
                         click.echo(
                             "  \t  "
@@ -267,7 +267,7 @@ def monitor(ctx, event, update, dry_run, chain):
 
                     elif (
                         pipe.detect_completion()
-                        and analysis.status.lower() == "running"
+                        and analysis.status == "running"
                     ):
                         if "profiling" not in analysis.meta:
                             analysis.meta["profiling"] = {}
@@ -376,7 +376,7 @@ def monitor(ctx, event, update, dry_run, chain):
         on_deck = [
             production
             for production in event.productions
-            if production.status.lower() in ACTIVE_STATES
+            if production.status in ACTIVE_STATES
         ]
 
         for production in on_deck:
@@ -388,13 +388,13 @@ def monitor(ctx, event, update, dry_run, chain):
             )
 
             # Jobs marked as ready can just be ignored as they've not been stood-up
-            if production.status.lower() == "ready":
-                click.secho(f"  \t  ● {production.status.lower()}", fg="green")
+            if production.status == "ready":
+                click.secho(f"  \t  ● {production.status}", fg="green")
                 logger.debug(f"Ready production: {event}/{production.name}")
                 continue
 
             # Deal with jobs which need to be stopped first
-            if production.status.lower() == "stop":
+            if production.status == "stop":
                 pipe = production.pipeline
                 logger.debug(f"Stop production: {event}/{production.name}")
                 if not dry_run:
@@ -465,7 +465,7 @@ def monitor(ctx, event, update, dry_run, chain):
 
                     pipe = production.pipeline
 
-                    if production.status.lower() == "stop":
+                    if production.status == "stop":
                         pipe.eject_job()
                         production.status = "stopped"
                         click.echo(
@@ -474,7 +474,7 @@ def monitor(ctx, event, update, dry_run, chain):
                             + f" {production.name} has been stopped"
                         )
                         job_list.refresh()
-                    elif production.status.lower() == "finished":
+                    elif production.status == "finished":
                         pipe.after_completion()
                         click.echo(
                             "  \t  "
@@ -482,7 +482,7 @@ def monitor(ctx, event, update, dry_run, chain):
                             + f" {production.name} has finished and post-processing has been started"
                         )
                         job_list.refresh()
-                    elif production.status.lower() == "processing":
+                    elif production.status == "processing":
                         # Need to check the upload has completed
                         if pipe.detect_completion_processing():
                             try:
@@ -503,7 +503,7 @@ def monitor(ctx, event, update, dry_run, chain):
                             )
                     elif (
                         pipe.detect_completion()
-                        and production.status.lower() == "processing"
+                        and production.status == "processing"
                     ):
                         click.echo(
                             "  \t  "
@@ -512,7 +512,7 @@ def monitor(ctx, event, update, dry_run, chain):
                         )
                     elif (
                         pipe.detect_completion()
-                        and production.status.lower() == "running"
+                        and production.status == "running"
                     ):
                         # The job has been completed, collect its assets
                         if "profiling" not in production.meta:
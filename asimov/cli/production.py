@@ -117,11 +117,11 @@ def set(event, production, status):
     and you should create a new production instead.
     """
     event = ledger.get_event(event=event)[0]
-    production = [
+    production = next(
         production_o
         for production_o in event.productions
         if production_o.name == production
-    ][0]
+    )
 
     accepted_states = {"ready", "wait", "stuck", "stop", "cancelled"}
     if status:
@@ -147,11 +147,11 @@ def show(event, production):
     Show the entire metadata for a given production.
     """
     event = ledger.get_event(event=event)[0]
-    production = [
+    production = next(
         production_o
         for production_o in event.productions
         if production_o.name == production
-    ][0]
+    )
 
     meta = copy(production.meta)
     meta.pop("ledger")
@@ -168,11 +168,11 @@ def results(event, production, file, hash=None):
     Fetch or list the results of a production.
     """
     event = ledger.get_event(event)[0]
-    production = [
+    production = next(
         production_o
         for production_o in event.productions
         if production_o.name == production
-    ][0]
+    )
     store = Store(root=config.get("storage", "directory"))
 
     if not file:
@@ -58,11 +58,11 @@ def add(event, production, status, message, other_subjects=None, pipeline=None):
             )
         else:
             for event in events:
-                production = [
+                production = next(
                     production_o
                     for production_o in event.productions
                     if production_o.name == production
-                ][0]
+                )
                 click.secho(event.name, bold=True)
 
                 if status.upper() in valid:
@@ -20,6 +20,16 @@ UTC = tz.tzutc()
 logger = logger.getChild("condor")
 logger.setLevel(LOGGER_LEVEL)
 
+status_map = {
+    0: "Unexplained",
+    1: "Idle",
+    2: "Running",
+    3: "Removed",
+    4: "Completed",
+    5: "Held",
+    6: "Submission error",
+}
+
 
 def datetime_from_epoch(dt, tzinfo=UTC):
     """Returns the `datetime.datetime` for a given Unix epoch
@@ -257,16 +267,7 @@ class CondorJob(yaml.YAMLObject):
         str
           A description of the status of the job.
         """
-        statuses = {
-            0: "Unexplained",
-            1: "Idle",
-            2: "Running",
-            3: "Removed",
-            4: "Completed",
-            5: "Held",
-            6: "Submission error",
-        }
-        return statuses[self._status]
+        return status_map[self._status]
 
 
 class CondorJobList:
@@ -234,13 +234,14 @@ class Event:
         self.productions.append(production)
         self.graph.add_node(production)
 
-        if production.dependencies:
-            for dependency in production.dependencies:
+        dependencies = production.dependencies
+        if dependencies:
+            analysis_dict = {
+                production_o.name: production_o for production_o in self.productions
+            }
+            for dependency in dependencies:
                 if dependency == production:
                     continue
-                analysis_dict = {
-                    production.name: production for production in self.productions
-                }
                 self.graph.add_edge(analysis_dict[dependency], production)
 
     def __repr__(self):
@@ -289,19 +290,6 @@ class Event:
                 "Some of the required parameters are missing from this issue."
             )
 
-        if "productions" in data:
-            if isinstance(data["productions"], type(None)):
-                data["productions"] = []
-
-        if "working directory" not in data:
-            data["working directory"] = os.path.join(
-                config.get("general", "rundir_default"), data["name"]
-            )
-
-        if not repo and "repository" in data:
-            data.pop("repository")
-        event = cls.from_dict(data, update=update, ledger=ledger)
-
         if "productions" in data:
             if isinstance(data["productions"], type(None)):
                 data["productions"] = []
@@ -438,10 +426,14 @@ class Event:
                     and production.meta["needs settings"]["condition"]
                     == "is_interesting"
                 ):
+                    # Only string requirements can name a pipeline
+                    needed_pipelines = frozenset(
+                        need for need in production._needs if isinstance(need, str)
+                    )
                     for prod in unfinished.reverse().nodes():
                         if (
                             prod.pipeline.name != production.pipeline.name
-                            and prod.pipeline.name in production._needs
+                            and prod.pipeline.name in needed_pipelines
                         ):
                             if prod.meta["interest status"] is True:
                                 interested_pipelines += 1
@@ -452,7 +444,7 @@ class Event:
                     ):
                         ends.append(production)
 
-        ready_values = {end for end in ends if end.status.lower() == "ready"}
+        ready_values = {end for end in ends if end.status == "ready"}
 
         return set(ready_values)  # only want to return one version of each production!
 
@@ -470,8 +462,7 @@ class Event:
         card += "<h4>Analyses</h4>"
         card += """<div class="list-group">"""
 
-        for production in self.productions:
-            card += production.html()
+        card += "".join(production.html() for production in self.productions)
 
         card += """</div>"""
 
@@ -14,6 +14,10 @@ from ..pipeline import Pipeline, PipelineException, PipelineLogger
 from .. import auth
 from .pesummary import PESummary
 
+# Patterns used to read the sampler progress from the bilby log files
+ITERATIONS_PATTERN = re.compile(r"([\d]+)it")
+DLOGZ_PATTERN = re.compile(r"dlogz:([\d]*\.[\d]*)")
+
 
 class Bilby(Pipeline):
     """
@@ -335,10 +339,8 @@ class Bilby(Pipeline):
                 with open(log, "r") as log_f:
                     message = log_f.read()
                     message = message.split("\n")[-1]
-                    p = re.compile(r"([\d]+)it")
-                    iterations = p.search(message)
-                    p = re.compile(r"dlogz:([\d]*\.[\d]*)")
-                    dlogz = p.search(message)
+                    iterations = ITERATIONS_PATTERN.search(message)
+                    dlogz = DLOGZ_PATTERN.search(message)
                     if iterations:
                         messages[log.split("/")[-1]] = (
                             iterations.group(),
@@ -27,6 +27,10 @@ from shutil import copyfile
 
 import yaml
 
+# Files are hashed in blocks of this many bytes so that large results
+# files never need to be held in memory all at once.
+HASH_BLOCKSIZE = 65536
+
 
 class NotAStoreError(Exception):
     pass
@@ -252,8 +256,8 @@ class Store:
         """
         hasher = hashlib.md5()
         with open(path, "rb") as afile:
-            buf = afile.read()
-            hasher.update(buf)
+            for buf in iter(lambda: afile.read(HASH_BLOCKSIZE), b""):
+                hasher.update(buf)
         return hasher.hexdigest()
 
     def add_file(self, event, production, file, new_name=None):
@@ -36,10 +36,7 @@ class TestBaseAnalysis(unittest.TestCase):
     @classmethod
     def tearDownClass(self):
         os.chdir(self.cwd)
-        try:
-            shutil.rmtree(f"{self.cwd}/tests/tmp/")
-        except FileNotFoundError:
-            pass
+        shutil.rmtree(f"{self.cwd}/tests/tmp/", ignore_errors=True)
 
     def tearDown(self):
         os.chdir(self.cwd)
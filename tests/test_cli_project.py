@@ -8,6 +8,7 @@ class TestCLI_Projects(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.cwd = os.getcwd()
+        cls.runner = CliRunner()
 
     
     def setUp(self):
@@ -21,16 +22,14 @@ class TestCLI_Projects(unittest.TestCase):
         
     def test_project_creation(self):
         os.chdir(f"{self.cwd}/tests/tmp/project")
-        runner = CliRunner()
-        result = runner.invoke(project.init,
-                               ['Test Project', '--root', f"{self.cwd}/tests/tmp/project"])
+        result = self.runner.invoke(project.init,
+                                    ['Test Project', '--root', f"{self.cwd}/tests/tmp/project"])
         assert result.exit_code == 0
         assert result.output == '● New project created successfully!\n'
 
     def test_project_creation_fails_missing_name(self):
         """Check that the command fails if no name is provided"""
         os.chdir(f"{self.cwd}/tests/tmp/project")
-        runner = CliRunner()
-        result = runner.invoke(project.init,
-                               [ '--root', f"{self.cwd}/tests/tmp/project"])
+        result = self.runner.invoke(project.init,
+                                    [ '--root', f"{self.cwd}/tests/tmp/project"])
         assert result.exit_code == 2
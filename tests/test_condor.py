@@ -14,25 +14,38 @@ class CondorTests(unittest.TestCase):
 #         cls.client = cls.app.test_client()
 
 
+    @classmethod
+    def setUpClass(cls):
+        cls.dictionary = {"id": 450,
+                          "command": "test.sh",
+                          "hosts": "test.test.com",
+                          "status": 1}
+
     def test_job_from_dict(self):
         """Check that a CondorJob object can be created from a dictionary."""
 
-        dictionary = {"id": 450,
-                      "command": "test.sh",
-                      "hosts": "test.test.com",
-                      "status": 1}
-
-        job = asimov.condor.CondorJob.from_dict(dictionary)
+        job = asimov.condor.CondorJob.from_dict(self.dictionary)
 
         self.assertEqual(job.idno, 450)
 
     def test_status(self):
         """Check that status codes get translated to a human-readable string."""
-        dictionary = {"id": 450,
-                      "command": "test.sh",
-                      "hosts": "test.test.com",
-                      "status": 1}
-
-        job = asimov.condor.CondorJob.from_dict(dictionary)
+        job = asimov.condor.CondorJob.from_dict(self.dictionary)
 
         self.assertEqual(job.status, "Idle")
+
+    def test_status_codes(self):
+        """Check that every condor status code has a human-readable string."""
+        job = asimov.condor.CondorJob.from_dict(self.dictionary)
+        expected = {0: "Unexplained",
+                    1: "Idle",
+                    2: "Running",
+                    3: "Removed",
+                    4: "Completed",
+                    5: "Held",
+                    6: "Submission error"}
+
+        for code, status in expected.items():
+            with self.subTest(code=code):
+                job._status = code
+                self.assertEqual(job.status, status)
@@ -126,8 +126,7 @@ class ReviewCliTests(unittest.TestCase):
     
     def setUp(self):
         project_dir = f"{self.cwd}/tests/tmp/"
-        if os.path.exists(project_dir):
-                    shutil.rmtree(project_dir)
+        shutil.rmtree(project_dir, ignore_errors=True)
         os.makedirs(f"{self.cwd}/tests/tmp/project")
         os.chdir(f"{self.cwd}/tests/tmp/project")
         runner = CliRunner()
@@ -2,42 +2,94 @@
 These tests are designed to verify that specific tests produce specific 
 outputs for each pipeline.
 """
+import hashlib
 import os
-import unittest
-import shutil
-import git
+import tempfile
+import time
+import requests
 import asimov.event
-from asimov.cli.project import make_project
 from asimov.cli.application import apply_page
-from asimov.ledger import YAMLLedger
+from asimov.testing import AsimovTestCase
 
 pipelines = {"bayeswave", "bilby", "rift"}
 EVENTS = {"GW150914_095045", "GW190924_021846", "GW190929_012149", "GW191109_010717"}
 
-class TestGravitationalWaveEvents(unittest.TestCase):
-    @classmethod
-    def setUpClass(cls):
-        cls.cwd = os.getcwd()
-        git.Repo.init(cls.cwd+"/tests/test_data/s000000xx/")
-        
-    def setUp(self):
-        os.makedirs(f"{self.cwd}/tests/tmp/project")
-        os.chdir(f"{self.cwd}/tests/tmp/project")
-        make_project(name="Test project", root=f"{self.cwd}/tests/tmp/project")
-        self.ledger = YAMLLedger(f".asimov/ledger.yml")
-        apply_page(file = "https://git.ligo.org/asimov/data/-/raw/main/defaults/production-pe.yaml", event=None, ledger=self.ledger)
+EXTERNAL_DEFAULTS_URL = "https://git.ligo.org/asimov/data/-/raw/main/defaults/production-pe.yaml"
+EXTERNAL_TESTS_BASE_URL = "https://git.ligo.org/asimov/data/-/raw/main/tests"
+
+BLUEPRINT_CACHE = os.path.join(tempfile.gettempdir(), "asimov_blueprints")
+BLUEPRINT_CACHE_AGE = 24 * 60 * 60
+
+
+def _write_cache(path, text):
+    """
+    Write a file into the blueprint cache.
+
+    The cache is shared between test runs, so the contents are written to a
+    temporary file first and then moved into place, ensuring another run
+    never reads a partially written file.
+    """
+    with tempfile.NamedTemporaryFile("w", dir=BLUEPRINT_CACHE, delete=False) as f:
+        f.write(text)
+    os.replace(f.name, path)
+
+
+def _fetch_blueprint(url):
+    """
+    Return the location of a local copy of a remote blueprint.
 
-    def tearDown(self):
-        os.chdir(self.cwd)
-        shutil.rmtree(f"{self.cwd}/tests/tmp/")
+    Blueprints are cached on disk, and are only downloaded again once the
+    cached copy is more than a day old, and then only if the server
+    reports that the file has changed.
+    """
+    os.makedirs(BLUEPRINT_CACHE, exist_ok=True)
+    cache_file = os.path.join(
+        BLUEPRINT_CACHE, hashlib.sha256(url.encode()).hexdigest() + ".yaml"
+    )
+    etag_file = cache_file + ".etag"
+
+    if os.path.exists(cache_file):
+        if time.time() - os.path.getmtime(cache_file) < BLUEPRINT_CACHE_AGE:
+            return cache_file
+
+    headers = {}
+    if os.path.exists(cache_file) and os.path.exists(etag_file):
+        with open(etag_file, "r") as f:
+            headers["If-None-Match"] = f.read()
+
+    r = requests.get(url, headers=headers)
+    if r.status_code == 304:
+        os.utime(cache_file)
+    elif r.status_code == 200:
+        # Drop the old ETag first so that it can never be paired with the
+        # new contents, even if the server does not send a replacement.
+        try:
+            os.remove(etag_file)
+        except FileNotFoundError:
+            pass
+        _write_cache(cache_file, r.text)
+        if "ETag" in r.headers:
+            _write_cache(etag_file, r.headers["ETag"])
+    else:
+        raise ValueError(f"Could not download this file: {url}")
+
+    return cache_file
+
+
+class TestGravitationalWaveEvents(AsimovTestCase):
+    def setUp(self):
+        super().setUp()
+        apply_page(file = _fetch_blueprint(EXTERNAL_DEFAULTS_URL), event=None, ledger=self.ledger)
 
     def test_fiducial_events(self):
         for event in EVENTS:
+            # The event only needs to be added to the ledger once; each
+            # pipeline blueprint is then applied on top of it.
+            apply_page(file = _fetch_blueprint(f"{EXTERNAL_TESTS_BASE_URL}/{event}.yaml"), event=None, ledger=self.ledger)
             for pipeline in pipelines:
                 with self.subTest(event=event, pipeline=pipeline):
-                    apply_page(file = f"https://git.ligo.org/asimov/data/-/raw/main/tests/{event}.yaml", event=None, ledger=self.ledger)
-                    apply_page(file = f"https://git.ligo.org/asimov/data/-/raw/main/tests/{pipeline}.yaml", event=event, ledger=self.ledger)
+                    apply_page(file = _fetch_blueprint(f"{EXTERNAL_TESTS_BASE_URL}/{pipeline}.yaml"), event=event, ledger=self.ledger)
 
                     event_o = self.ledger.get_event(event)[0]
                     production = event_o.productions[0]
-                    production.make_config(f"{self.cwd}/tests/tmp/test_config.ini")
+                    production.make_config(f"{self.cwd}/tests/tmp/test_config_{event}_{pipeline}.ini")